@@ -15,12 +15,12 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Mapping, Union
 
 import attrs
-import google.cloud.pubsub_v1
 
 from . import registry, types_, exceptions
 from .schema import Schema  # so 'schema' module doesn't clobber 'Alert.schema' attribute
 
 if TYPE_CHECKING:
+    import google.cloud.pubsub_v1  # always lazy-load the Pub/Sub API. it is slow to import.
     import pandas as pd  # always lazy-load pandas. it hogs memory on cloud functions and run
 
 LOGGER = logging.getLogger(__name__)
@@ -55,7 +55,7 @@ class Alert:
     _dict: Mapping | None = attrs.field(default=None)
     _attributes: Mapping[str, str] | None = attrs.field(default=None)
     schema_name: str | None = attrs.field(default=None)
-    msg: google.cloud.pubsub_v1.types.PubsubMessage | types_.PubsubMessageLike | None = (
+    msg: Union["google.cloud.pubsub_v1.types.PubsubMessage", types_.PubsubMessageLike, None] = (
         attrs.field(default=None)
     )
     path: Path | None = attrs.field(default=None)
@@ -15,6 +15,7 @@
 
 ----
 """
+import functools
 import logging
 import os
 
@@ -28,6 +29,33 @@ from requests_oauthlib import OAuth2Session
 LOGGER = logging.getLogger(__name__)
 
 
+def _load_credentials_from_file(filename: str) -> tuple:
+    """Load service account credentials from a key file.
+
+    Cached so that every :class:`Auth` pointing at the same key file gets the same credentials
+    object. This only saves re-reading and parsing the file. Each Google Cloud client keeps its own
+    scoped copy of the credentials and refreshes its own access token. The main use is that
+    :mod:`pittgoogle.pubsub` keys its shared SubscriberClients on this object, so Auths using the
+    same key file can share a client.
+
+    The file's modification time is part of the cache key, so a key that is rotated in place at
+    the same path is picked up. The cache holds at most 16 entries, and they are kept for the life
+    of the process. The cost is a few small credentials objects, which is acceptable for that use.
+    """
+    try:
+        mtime_ns = os.stat(filename).st_mtime_ns
+    # no usable file. let google.auth raise its usual error (DefaultCredentialsError or TypeError)
+    except (TypeError, OSError):
+        return google.auth.load_credentials_from_file(filename)
+    return _load_credentials_from_file_cached(filename, mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_credentials_from_file_cached(filename: str, mtime_ns: int) -> tuple:
+    """Cached body of :func:`_load_credentials_from_file`. ``mtime_ns`` is only a cache key."""
+    return google.auth.load_credentials_from_file(filename)
+
+
 @attrs.define
 class Auth:
     """Credentials for authenticating with a Google Cloud project.
@@ -115,21 +143,21 @@ class Auth:
         """
         # service account credentials
         try:
-            credentials, project = google.auth.load_credentials_from_file(
-                self.GOOGLE_APPLICATION_CREDENTIALS
-            )
+            credentials, project = _load_credentials_from_file(self.GOOGLE_APPLICATION_CREDENTIALS)
 
         # OAuth2
         except (TypeError, google.auth.exceptions.DefaultCredentialsError) as ekeyfile:
             LOGGER.warning(
                 (
                     "Service account credentials not found for "
-                    f"\nGOOGLE_CLOUD_PROJECT {self.GOOGLE_CLOUD_PROJECT} "
-                    f"\nGOOGLE_APPLICATION_CREDENTIALS {self.GOOGLE_APPLICATION_CREDENTIALS}"
+                    "\nGOOGLE_CLOUD_PROJECT %s "
+                    "\nGOOGLE_APPLICATION_CREDENTIALS %s"
                     "\nFalling back to OAuth2. "
                     "If this is unexpected, check the kwargs you passed or "
                     "try setting environment variables."
-                )
+                ),
+                self.GOOGLE_CLOUD_PROJECT,
+                self.GOOGLE_APPLICATION_CREDENTIALS,
             )
             try:
                 credentials = google_auth_oauthlib.helpers.credentials_from_session(self.oauth2)
@@ -151,7 +179,7 @@ class Auth:
                     )
                 )
 
-        LOGGER.info(f"Authenticated to Google Cloud project {self.GOOGLE_CLOUD_PROJECT}")
+        LOGGER.info("Authenticated to Google Cloud project %s", self.GOOGLE_CLOUD_PROJECT)
 
         return credentials
 
@@ -210,6 +238,6 @@ class Auth:
             authorization_response=authorization_response,
             client_secret=client_secret,
         )
-        LOGGER.info(f"Authenticated to Google Cloud project {self.GOOGLE_CLOUD_PROJECT}")
+        LOGGER.info("Authenticated to Google Cloud project %s", self.GOOGLE_CLOUD_PROJECT)
 
         return oauth2
@@ -12,12 +12,13 @@ import logging
 from typing import TYPE_CHECKING, Optional
 
 import attrs
-import google.cloud.bigquery
 
 from .alert import Alert
 from .auth import Auth
 
 if TYPE_CHECKING:
+    # always lazy-load the BigQuery API. it is slow to import and not needed to work with alerts.
+    import google.cloud.bigquery
     import pandas as pd  # always lazy-load pandas. it hogs memory on cloud functions and run
 
 LOGGER = logging.getLogger(__name__)
@@ -33,7 +34,7 @@ class Client:
     _auth: Auth = attrs.field(
         default=None, validator=attrs.validators.optional(attrs.validators.instance_of(Auth))
     )
-    _client: google.cloud.bigquery.Client | None = attrs.field(default=None)
+    _client: Optional["google.cloud.bigquery.Client"] = attrs.field(default=None)
 
     def __getattr__(self, attr):
         """If ``attr`` doesn't exist in this class, try getting it from the underlying ``google.cloud.bigquery.Client``.
@@ -59,7 +60,7 @@ class Client:
         return self._auth
 
     @property
-    def client(self) -> google.cloud.bigquery.Client:
+    def client(self) -> "google.cloud.bigquery.Client":
         """Google Cloud BigQuery client.
 
         If the client has not been initialized yet, it will be created using :attr:`Client.auth`.
@@ -69,6 +70,8 @@ class Client:
                 An instance of the Google Cloud BigQuery client.
         """
         if self._client is None:
+            import google.cloud.bigquery
+
             self._client = google.cloud.bigquery.Client(credentials=self.auth.credentials)
         return self._client
 
@@ -143,6 +146,8 @@ class Client:
 
                 diaobject_df = bqclient.query(query=sql)
         """
+        import google.cloud.bigquery
+
         # Submit
         job_config = google.cloud.bigquery.QueryJobConfig(**job_config_kwargs)
         query_job = self.client.query(query, job_config=job_config)
@@ -207,7 +212,7 @@ class Table:
     """BigQuery client used to access the table."""
     # The rest don't need string descriptions because they are explicitly defined as properties below.
     _projectid: str = attrs.field(default=None)
-    _table: google.cloud.bigquery.Table | None = attrs.field(default=None, init=False)
+    _table: Optional["google.cloud.bigquery.Table"] = attrs.field(default=None, init=False)
     _schema: Optional["pd.DataFrame"] = attrs.field(default=None, init=False)
 
     @classmethod
@@ -248,6 +253,8 @@ class Table:
             Table:
                 The `Table` object.
         """
+        import google.cloud.bigquery
+
         if dataset is None:
             dataset = survey
         # if testid is not False, "False", or None, append it to the dataset
@@ -289,7 +296,7 @@ class Table:
         return self._projectid
 
     @property
-    def table(self) -> google.cloud.bigquery.Table:
+    def table(self) -> "google.cloud.bigquery.Table":
         """Google Cloud BigQuery Table object.
 
         Makes a `get_table` request if necessary.
@@ -339,7 +346,7 @@ class Table:
         myrows = [row.dict if isinstance(row, Alert) else row for row in rows]
         errors = self.client.insert_rows(self.table, myrows)
         if len(errors) > 0:
-            LOGGER.warning(f"BigQuery insert error: {errors}")
+            LOGGER.warning("BigQuery insert error: %s", errors)
         return errors
 
     def query(
@@ -10,25 +10,84 @@
 
 ----
 """
+import collections
 import concurrent.futures
 import datetime
 import importlib.resources
 import logging
-import queue
-import time
-from typing import Any, Callable, List, Optional, Union
+import re
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
 
 import attrs
 import attrs.validators
-import google.api_core.exceptions
-import google.cloud.pubsub_v1
 
 from . import exceptions
 from .alert import Alert
 from .auth import Auth
 
+if TYPE_CHECKING:
+    # always lazy-load the Pub/Sub API. it pulls in grpc and protobuf, which are slow to import.
+    import google.cloud.pubsub_v1
+
 LOGGER = logging.getLogger(__name__)
 PACKAGE_DIR = importlib.resources.files(__package__)
+_TOPIC_PATH_RE = re.compile(r"projects/([^/]+)/topics/([^/]+)")
+
+# SubscriberClients for service account credentials, keyed by the project and the credentials object.
+# Auths that load the same key file get the same credentials object (see pittgoogle.auth), so
+# subscriptions using them share a gRPC channel even if each one made its own Auth (the default).
+# Clients are only weakly referenced, so they are dropped once no subscription is using them.
+_SUBSCRIBER_CLIENTS: "weakref.WeakValueDictionary[tuple, google.cloud.pubsub_v1.SubscriberClient]" = (
+    weakref.WeakValueDictionary()
+)
+_SUBSCRIBER_CLIENTS_LOCK = threading.Lock()
+
+
+def _instance_of_pubsub_client(client_name: str) -> Callable:
+    """Return an attrs validator that checks for a ``google.cloud.pubsub_v1`` client.
+
+    The validator imports the Pub/Sub API only when a client is actually passed in.
+    """
+
+    def validator(instance, attribute, value) -> None:
+        import google.cloud.pubsub_v1
+
+        client_type = getattr(google.cloud.pubsub_v1, client_name)
+        attrs.validators.instance_of(client_type)(instance, attribute, value)
+
+    return validator
+
+
+def _subscriber_client(auth: Auth) -> "google.cloud.pubsub_v1.SubscriberClient":
+    """Return a SubscriberClient using ``auth.credentials``.
+
+    Clients for service account credentials are shared. OAuth2 credentials belong to whichever
+    user logged in, so those always get a new client.
+    """
+    import google.cloud.pubsub_v1
+
+    # Load the credentials before taking the lock. This can fall back to the interactive OAuth2
+    # flow, which must not block other threads.
+    credentials = auth.credentials
+    if auth.GOOGLE_APPLICATION_CREDENTIALS is None:
+        return google.cloud.pubsub_v1.SubscriberClient(credentials=credentials)
+
+    key = (auth.GOOGLE_CLOUD_PROJECT, credentials)
+    # Lock so that concurrent callers don't each open a channel for the same credentials.
+    with _SUBSCRIBER_CLIENTS_LOCK:
+        client = _SUBSCRIBER_CLIENTS.get(key)
+        if client is None or client.closed:
+            client = google.cloud.pubsub_v1.SubscriberClient(credentials=credentials)
+            _SUBSCRIBER_CLIENTS[key] = client
+    return client
+
+
+def _reset_path(instance, attribute, value) -> Any:
+    """attrs ``on_setattr`` hook that clears the cached ``path`` when a field it depends on changes."""
+    instance._path = None
+    return value
 
 
 def msg_callback_example(alert: Alert) -> "Response":
@@ -67,24 +126,25 @@ def pull_batch(
         list[Alert]:
             A list of Alert objects representing the pulled messages.
     """
+    import google.api_core.exceptions
+
     if isinstance(subscription, str):
         subscription = Subscription(subscription, **subscription_kwargs)
+    client, path = subscription.client, subscription.path
 
     try:
-        response = subscription.client.pull(
-            {"subscription": subscription.path, "max_messages": max_messages}
-        )
+        response = client.pull({"subscription": path, "max_messages": max_messages})
     except google.api_core.exceptions.NotFound as excep:
-        msg = f"NotFound: {subscription.path}. You may need to create the subscription using `pittgoogle.Subscription.touch`."
+        msg = f"NotFound: {path}. You may need to create the subscription using `pittgoogle.Subscription.touch`."
         raise exceptions.CloudConnectionError(msg) from excep
 
-    alerts = [
-        Alert.from_msg(msg.message, schema_name=schema_name) for msg in response.received_messages
-    ]
+    alerts, ack_ids = [], []
+    for msg in response.received_messages:
+        alerts.append(Alert.from_msg(msg.message, schema_name=schema_name))
+        ack_ids.append(msg.ack_id)
 
-    ack_ids = [msg.ack_id for msg in response.received_messages]
     if len(ack_ids) > 0:
-        subscription.client.acknowledge({"subscription": subscription.path, "ack_ids": ack_ids})
+        client.acknowledge({"subscription": path, "ack_ids": ack_ids})
 
     return alerts
 
@@ -129,17 +189,17 @@ class Topic:
     ----
     """
 
-    name: str = attrs.field()
-    _projectid: str = attrs.field(default=None)
+    name: str = attrs.field(on_setattr=_reset_path)
+    _projectid: str = attrs.field(default=None, on_setattr=_reset_path)
     _auth: Auth = attrs.field(
         default=None, validator=attrs.validators.optional(attrs.validators.instance_of(Auth))
     )
-    _client: Optional[google.cloud.pubsub_v1.PublisherClient] = attrs.field(
+    _client: Optional["google.cloud.pubsub_v1.PublisherClient"] = attrs.field(
         default=None,
-        validator=attrs.validators.optional(
-            attrs.validators.instance_of(google.cloud.pubsub_v1.PublisherClient)
-        ),
+        validator=attrs.validators.optional(_instance_of_pubsub_client("PublisherClient")),
     )
+    # Cached value of the path property. Cleared by _reset_path.
+    _path: str | None = attrs.field(default=None, init=False, repr=False, eq=False)
 
     @classmethod
     def from_cloud(
@@ -175,12 +235,24 @@ class Topic:
         # must accommodate False and "False" for consistency with the broker pipeline
         if testid and testid != "False":
             name = f"{name}-{testid}"
+
+        import google.cloud.pubsub_v1
+
         return cls(name, projectid=projectid, client=google.cloud.pubsub_v1.PublisherClient())
 
     @classmethod
     def from_path(cls, path) -> "Topic":
-        """Parse the ``path`` and return a new :class:`Topic`."""
-        _, projectid, _, name = path.split("/")
+        """Parse the ``path`` and return a new :class:`Topic`.
+
+        Raises:
+            ValueError:
+                If ``path`` does not have the form 'projects/<projectid>/topics/<name>'.
+        """
+        match = _TOPIC_PATH_RE.fullmatch(path)
+        if match is None:
+            msg = f"Invalid topic path: {path}. Expected 'projects/<projectid>/topics/<name>'."
+            raise ValueError(msg)
+        projectid, name = match.groups()
         return cls(name, projectid)
 
     @property
@@ -196,7 +268,9 @@ class Topic:
     @property
     def path(self) -> str:
         """Fully qualified path to the topic."""
-        return f"projects/{self.projectid}/topics/{self.name}"
+        if self._path is None:
+            self._path = f"projects/{self.projectid}/topics/{self.name}"
+        return self._path
 
     @property
     def projectid(self) -> str:
@@ -206,12 +280,14 @@ class Topic:
         return self._projectid
 
     @property
-    def client(self) -> google.cloud.pubsub_v1.PublisherClient:
+    def client(self) -> "google.cloud.pubsub_v1.PublisherClient":
         """Pub/Sub client for topic access.
 
         Will be created using :attr:`Topic.auth.credentials` if necessary.
         """
         if self._client is None:
+            import google.cloud.pubsub_v1
+
             self._client = google.cloud.pubsub_v1.PublisherClient(
                 credentials=self.auth.credentials
             )
@@ -229,16 +305,19 @@ class Topic:
             CloudConnectionError:
                 'PermissionDenied' if :attr:`Topic.auth` does not have permission to get or create the table.
         """
+        import google.api_core.exceptions
+
+        client, path = self.client, self.path
         try:
             # Check if topic exists and we can connect.
-            self.client.get_topic(topic=self.path)
-            LOGGER.info(f"topic exists: {self.path}")
+            client.get_topic(topic=path)
+            LOGGER.info("topic exists: %s", path)
 
         except google.api_core.exceptions.NotFound:
             try:
                 # Try to create a new topic.
-                self.client.create_topic(name=self.path)
-                LOGGER.info(f"topic created: {self.path}")
+                client.create_topic(name=path)
+                LOGGER.info("topic created: %s", path)
 
             except google.api_core.exceptions.PermissionDenied as excep:
                 # User has access to this topic's project but insufficient permissions to create a new topic.
@@ -255,7 +334,7 @@ class Topic:
             # This is not a problem if they only want to subscribe, but can be confusing.
             # [TODO] Maybe users should just be allowed to get the topic?
             msg = (
-                f"PermissionDenied: The provided `pittgoogle.Auth` cannot get topic {self.path}. "
+                f"PermissionDenied: The provided `pittgoogle.Auth` cannot get topic {path}. "
                 "Either the provided Auth has a different project ID, or your credentials just don't "
                 "have appropriate IAM permissions. \nNote that if you are a user trying to connect to "
                 "a Pitt-Google topic, your Auth is _expected_ to have a different project ID and you "
@@ -266,18 +345,21 @@ class Topic:
 
     def delete(self) -> None:
         """Delete the topic."""
+        import google.api_core.exceptions
+
+        path = self.path
         try:
-            self.client.delete_topic(topic=self.path)
+            self.client.delete_topic(topic=path)
         except google.api_core.exceptions.NotFound:
-            LOGGER.info(f"nothing to delete. topic not found: {self.path}")
+            LOGGER.info("nothing to delete. topic not found: %s", path)
         else:
-            LOGGER.info(f"deleted topic: {self.path}")
+            LOGGER.info("deleted topic: %s", path)
 
     def publish(self, alert: "Alert") -> int:
         """Publish a message with :attr:`pittgoogle.Alert.dict` as the payload and
         :attr:`pittgoogle.Alert.attributes` as the attributes."""
         # Pub/Sub requires attribute keys and values to be strings. Sort the keys while we're at it.
-        attributes = {str(key): str(alert.attributes[key]) for key in sorted(alert.attributes)}
+        attributes = {str(key): str(value) for key, value in sorted(alert.attributes.items())}
         message = alert.schema.serialize(alert.dict)
 
         future = self.client.publish(self.path, data=message, **attributes)
@@ -330,13 +412,13 @@ class Subscription:
     topic: Optional[Topic] = attrs.field(
         default=None, validator=attrs.validators.optional(attrs.validators.instance_of(Topic))
     )
-    _client: Optional[google.cloud.pubsub_v1.SubscriberClient] = attrs.field(
+    _client: Optional["google.cloud.pubsub_v1.SubscriberClient"] = attrs.field(
         default=None,
-        validator=attrs.validators.optional(
-            attrs.validators.instance_of(google.cloud.pubsub_v1.SubscriberClient)
-        ),
+        validator=attrs.validators.optional(_instance_of_pubsub_client("SubscriberClient")),
     )
     schema_name: str | None = attrs.field(default=None)
+    # Whether _client was created by the client property rather than passed in by the user.
+    _default_client: bool = attrs.field(default=False, init=False, repr=False, eq=False)
 
     @property
     def projectid(self) -> str:
@@ -346,18 +428,21 @@ class Subscription:
     @property
     def path(self) -> str:
         """Fully qualified path to the subscription."""
+        # Not cached. The project ID is read from the Auth, which can be changed in place.
         return f"projects/{self.projectid}/subscriptions/{self.name}"
 
     @property
-    def client(self) -> google.cloud.pubsub_v1.SubscriberClient:
+    def client(self) -> "google.cloud.pubsub_v1.SubscriberClient":
         """Pub/Sub client that will be used to access the subscription.
 
-        If not provided, a new client will be created using :attr:`Subscription.auth`.
+        If not provided, a client will be created using :attr:`Subscription.auth`. Subscriptions
+        whose :class:`pittgoogle.Auth` objects use the same service account key file share this
+        client, so do not close it. Closing it breaks every other Subscription and Consumer that
+        holds it. To manage the client's lifetime yourself, pass your own ``client``.
         """
         if self._client is None:
-            self._client = google.cloud.pubsub_v1.SubscriberClient(
-                credentials=self.auth.credentials
-            )
+            self._client = _subscriber_client(self.auth)
+            self._default_client = True
         return self._client
 
     def touch(self) -> None:
@@ -376,26 +461,34 @@ class Subscription:
                 - 'InvalidTopic' if the subscription exists but the user explicitly provided a topic that
                    this subscription is not actually attached to.
         """
+        import google.api_core.exceptions
+
+        path = self.path
+
+        # Look up first. The subscription usually exists already (e.g., a Consumer restarting).
         try:
-            subscrip = self.client.get_subscription(subscription=self.path)
-            LOGGER.info(f"subscription exists: {self.path}")
+            subscrip = self.client.get_subscription(subscription=path)
+            LOGGER.info("subscription exists: %s", path)
 
         except google.api_core.exceptions.NotFound:
             subscrip = self._create()  # may raise TypeError or CloudConnectionError
-            LOGGER.info(f"subscription created: {self.path}")
+            LOGGER.info("subscription created: %s", path)
 
         self._set_topic(subscrip.topic)  # may raise CloudConnectionError
 
-    def _create(self) -> google.cloud.pubsub_v1.types.Subscription:
+    def _create(self) -> "google.cloud.pubsub_v1.types.Subscription":
+        import google.api_core.exceptions
+
         if self.topic is None:
             raise TypeError("The subscription needs to be created but no topic was provided.")
 
+        topic_path = self.topic.path
         try:
-            return self.client.create_subscription(name=self.path, topic=self.topic.path)
+            return self.client.create_subscription(name=self.path, topic=topic_path)
 
         # this error message is not very clear. let's help.
         except google.api_core.exceptions.NotFound as excep:
-            msg = f"NotFound: The subscription cannot be created because the topic does not exist: {self.topic.path}"
+            msg = f"NotFound: The subscription cannot be created because the topic does not exist: {topic_path}"
             raise exceptions.CloudConnectionError(msg) from excep
 
     def _set_topic(self, connected_topic_path) -> None:
@@ -416,12 +509,15 @@ class Subscription:
 
     def delete(self) -> None:
         """Delete the subscription."""
+        import google.api_core.exceptions
+
+        path = self.path
         try:
-            self.client.delete_subscription(subscription=self.path)
+            self.client.delete_subscription(subscription=path)
         except google.api_core.exceptions.NotFound:
-            LOGGER.info(f"nothing to delete. subscription not found: {self.path}")
+            LOGGER.info("nothing to delete. subscription not found: %s", path)
         else:
-            LOGGER.info(f"deleted subscription: {self.path}")
+            LOGGER.info("deleted subscription: %s", path)
 
     def pull_batch(self, max_messages: int = 1) -> List["Alert"]:
         """Pull a single batch of messages.
@@ -444,19 +540,26 @@ class Subscription:
         # Wrapping the module-level function
         return pull_batch(self, max_messages=max_messages, schema_name=self.schema_name)
 
-    def purge(self):
-        """Purge all messages from the subscription."""
-        msg = (
-            "WARNING: This is permanent.\n"
-            f"Are you sure you want to purge all messages from the subscription\n{self.path}?\n"
-            "(y/[n]): "
-        )
-        proceed = input(msg)
-        if proceed.lower() == "y":
-            LOGGER.info(f"Purging all messages from subscription {self.path}")
-            _ = self.client.seek(
-                request=dict(subscription=self.path, time=datetime.datetime.now())
+    def purge(self, *, confirm: bool = True) -> None:
+        """Purge all messages from the subscription.
+
+        Args:
+            confirm (bool, optional):
+                Whether to ask for confirmation on the command line before purging. Set this to
+                `False` to purge without prompting (e.g., in scripts and other non-interactive code).
+        """
+        path = self.path
+        if confirm:
+            msg = (
+                "WARNING: This is permanent.\n"
+                f"Are you sure you want to purge all messages from the subscription\n{path}?\n"
+                "(y/[n]): "
             )
+            if input(msg).lower() != "y":
+                return
+
+        LOGGER.info("Purging all messages from subscription %s", path)
+        _ = self.client.seek(request=dict(subscription=path, time=datetime.datetime.now()))
 
 
 @attrs.define
@@ -470,7 +573,10 @@ class Consumer:
             Function that will process a single message. It should accept a Alert and return a Response.
         batch_callback (callable, optional):
             Function that will process a batch of results. It should accept a list of the results
-            returned by the msg_callback.
+            returned by the msg_callback. Results are queued in memory until the batch callback
+            takes them, and this queue is not bounded: ``max_backlog`` and ``max_backlog_bytes`` only
+            limit unacknowledged messages, and each message is acknowledged as soon as its result is
+            queued. If the batch callback is slower than the message callbacks, memory use grows.
         batch_maxn (int, optional):
             Maximum number of messages in a batch. This has no effect if batch_callback is None.
         batch_max_wait_between_messages (int, optional):
@@ -478,10 +584,29 @@ class Consumer:
             no effect if batch_callback is None.
         max_backlog (int, optional):
             Maximum number of pulled but unprocessed messages before pausing the pull.
+            This is shared by all streams if ``num_streams`` is greater than 1.
+        max_backlog_bytes (int, optional):
+            Maximum total size (in bytes) of pulled but unprocessed messages before pausing the pull.
+            Large alerts (e.g., with cutouts) can hit this limit before ``max_backlog`` is reached.
+            This is shared by all streams if ``num_streams`` is greater than 1.
+        max_lease_duration (int, optional):
+            Maximum number of seconds to hold a pulled message's lease (extending its ack deadline)
+            before giving up on it, so that Pub/Sub redelivers it. Raise this if the message callback
+            can take longer than the default of one hour to process a message.
         max_workers (int, optional):
             Maximum number of workers for the executor. This has no effect if an executor is provided.
+            If None (default), Python's ``ThreadPoolExecutor`` default of ``min(32, cpu_count + 4)``
+            is used.
         executor (concurrent.futures.ThreadPoolExecutor, optional):
             Executor to be used by the Google API to pull and process messages in the background.
+            If ``num_streams`` is greater than 1, this is used by the first stream only and each
+            additional stream gets its own executor with ``max_workers`` workers.
+        num_streams (int, optional):
+            Number of streaming pulls to open in parallel on the subscription. A single stream is
+            limited by Pub/Sub to roughly 10 MB/s, so high-volume subscriptions may need more than one.
+            All streams feed the same callbacks. Each additional stream opens its own client (and
+            gRPC channel) using :attr:`Subscription.auth`, unless the subscription was given a
+            ``client``, in which case every stream uses that client.
 
     Example:
 
@@ -527,9 +652,15 @@ class Consumer:
     batch_callback: Optional[Callable[[list], None]] = attrs.field(
         default=None, validator=attrs.validators.optional(attrs.validators.is_callable())
     )
-    batch_maxn: int = attrs.field(default=100, converter=int)
+    batch_maxn: int = attrs.field(default=100, converter=int, validator=attrs.validators.gt(0))
     batch_max_wait_between_messages: int = attrs.field(default=30, converter=int)
     max_backlog: int = attrs.field(default=1000, validator=attrs.validators.gt(0))
+    max_backlog_bytes: int = attrs.field(
+        default=100 * 1024 * 1024, validator=attrs.validators.gt(0), kw_only=True
+    )
+    max_lease_duration: int = attrs.field(
+        default=60 * 60, validator=attrs.validators.gt(0), kw_only=True
+    )
     max_workers: Optional[int] = attrs.field(
         default=None, validator=attrs.validators.optional(attrs.validators.instance_of(int))
     )
@@ -539,9 +670,16 @@ class Consumer:
             attrs.validators.instance_of(concurrent.futures.ThreadPoolExecutor)
         ),
     )
-    _queue: queue.Queue = attrs.field(factory=queue.Queue, init=False)
-    streaming_pull_future: google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture = (
-        attrs.field(default=None, init=False)
+    num_streams: int = attrs.field(default=1, validator=attrs.validators.gt(0), kw_only=True)
+    # Results waiting for the batch callback. The message callbacks append and set the event.
+    _results: collections.deque = attrs.field(factory=collections.deque, init=False)
+    _results_ready: threading.Event = attrs.field(factory=threading.Event, init=False)
+    streaming_pull_futures: List["google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture"] = (
+        attrs.field(factory=list, init=False)
+    )
+    # Clients opened for the streams after the first. These are closed by stop().
+    _stream_clients: List["google.cloud.pubsub_v1.SubscriberClient"] = attrs.field(
+        factory=list, init=False, repr=False
     )
 
     @property
@@ -556,9 +694,25 @@ class Consumer:
     def executor(self) -> concurrent.futures.ThreadPoolExecutor:
         """Executor to be used by the Google API for a streaming pull."""
         if self._executor is None:
-            self._executor = concurrent.futures.ThreadPoolExecutor(self.max_workers)
+            self._executor = self._new_executor()
         return self._executor
 
+    def _new_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        # Name the threads so the message callbacks are easy to pick out in thread dumps and logs.
+        return concurrent.futures.ThreadPoolExecutor(
+            self.max_workers, thread_name_prefix="pittgoogle-consumer"
+        )
+
+    @property
+    def streaming_pull_future(
+        self,
+    ) -> Optional["google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture"]:
+        """Future for the first open streaming pull, or None if the stream has not been opened.
+
+        See :attr:`Consumer.streaming_pull_futures` for all streams.
+        """
+        return self.streaming_pull_futures[0] if self.streaming_pull_futures else None
+
     def stream(self, block: bool = True) -> None:
         """Open the stream in a background thread and process messages through the callbacks.
 
@@ -589,26 +743,87 @@ class Consumer:
             raise
 
     def _open_stream(self) -> None:
-        """Open a streaming pull and process messages in the background."""
-        LOGGER.info(f"opening a streaming pull on subscription: {self.subscription.path}")
-        self.streaming_pull_future = self.subscription.client.subscribe(
+        """Open the streaming pull(s) and process messages in the background."""
+        import google.cloud.pubsub_v1
+
+        LOGGER.info(
+            "opening %d streaming pull(s) on subscription: %s",
+            self.num_streams,
             self.subscription.path,
-            self._callback,
-            flow_control=google.cloud.pubsub_v1.types.FlowControl(max_messages=self.max_backlog),
-            scheduler=google.cloud.pubsub_v1.subscriber.scheduler.ThreadScheduler(
-                executor=self.executor
-            ),
-            await_callbacks_on_shutdown=True,
         )
+        # Each stream needs its own executor because closing a stream shuts its executor down.
+        executors = [self.executor] + [self._new_executor() for _ in range(self.num_streams - 1)]
+        # Streams that share a client are multiplexed over one gRPC channel, which caps their
+        # combined throughput. Give each additional stream its own client (and channel), unless the
+        # user passed in a client. Its endpoint and options can't be copied, so all streams use it.
+        client = self.subscription.client
+        if self.subscription._default_client:
+            self._stream_clients = [
+                google.cloud.pubsub_v1.SubscriberClient(
+                    credentials=self.subscription.auth.credentials
+                )
+                for _ in range(self.num_streams - 1)
+            ]
+            clients = [client] + self._stream_clients
+        else:
+            clients = [client] * self.num_streams
+        # Results are only consumed by the batch callback, so only queue them if there is one.
+        callback = self._callback if self.batch_callback is None else self._callback_with_results
+        # Split the backlog limits across the streams (rounding up) so the total stays the same.
+        flow_control = google.cloud.pubsub_v1.types.FlowControl(
+            max_messages=-(-self.max_backlog // self.num_streams),
+            max_bytes=-(-self.max_backlog_bytes // self.num_streams),
+            max_lease_duration=self.max_lease_duration,
+        )
+        # Register each stream as soon as it opens so that stop() can reach it if a later one fails.
+        self.streaming_pull_futures = []
+        try:
+            for client, executor in zip(clients, executors):
+                future = client.subscribe(
+                    self.subscription.path,
+                    callback,
+                    flow_control=flow_control,
+                    scheduler=google.cloud.pubsub_v1.subscriber.scheduler.ThreadScheduler(
+                        executor=executor
+                    ),
+                    await_callbacks_on_shutdown=True,
+                )
+                self.streaming_pull_futures.append(future)
+
+        # don't leave the streams that did open pulling (and acking) messages in the background
+        except Exception:
+            # the extra executors that never got a stream. self.executor is kept for reuse.
+            for executor in executors[max(1, len(self.streaming_pull_futures)) :]:
+                executor.shutdown(wait=False)
+            self.stop()
+            raise
+
+    def _callback(self, message: "google.cloud.pubsub_v1.types.PubsubMessage") -> None:
+        """Unpack the message, run the :attr:`~Consumer.msg_callback` and handle the response.
 
-    def _callback(self, message: google.cloud.pubsub_v1.types.PubsubMessage) -> None:
-        """Unpack the message, run the :attr:`~Consumer.msg_callback` and handle the response."""
+        This is used when there is no :attr:`~Consumer.batch_callback`, so results are dropped.
+        """
         # LOGGER.info("callback started")
-        response = self.msg_callback(Alert(msg=message))  # Response
-        # LOGGER.info(f"{response.result}")
+        # _open_stream already resolved the subscription, so skip the property and read the slot.
+        alert = Alert.from_msg(message, schema_name=self._subscription.schema_name)
+        response = self.msg_callback(alert)  # Response
+        # LOGGER.info("%s", response.result)
+
+        if response.ack:
+            message.ack()
+        else:
+            message.nack()
+
+    def _callback_with_results(self, message: "google.cloud.pubsub_v1.types.PubsubMessage") -> None:
+        """Same as :meth:`Consumer._callback`, but also queue the result for the batch callback."""
+        alert = Alert.from_msg(message, schema_name=self._subscription.schema_name)
+        response = self.msg_callback(alert)  # Response
 
         if response.result is not None:
-            self._queue.put(response.result)
+            # deque.append is thread-safe. only touch the event's lock if the reader may be waiting.
+            self._results.append(response.result)
+            if not self._results_ready.is_set():
+                self._results_ready.set()
 
         if response.ack:
             message.ack()
@@ -616,46 +831,97 @@ class Consumer:
             message.nack()
 
     def _process_batches(self):
-        """Run the batch callback if provided, otherwise just sleep.
+        """Run the batch callback if provided, otherwise wait on the streaming pull(s).
 
-        This never returns -- it runs until it encounters an error.
+        This returns when a stream closes and raises the stream's error, if any. With a batch
+        callback, the results that were already queued are processed first.
         """
-        # if there's no batch_callback there's nothing to do except wait until the process is killed
+        # if there's no batch_callback there's nothing to do except wait for a stream to close
         if self.batch_callback is None:
-            while True:
-                time.sleep(60)
-
-        batch, count = [], 0
-        while True:
-            try:
-                batch.append(
-                    self._queue.get(block=True, timeout=self.batch_max_wait_between_messages)
+            done = None
+            # wait in short steps. on Windows, Ctrl-C can't interrupt a lock wait without a timeout.
+            while not done:
+                done, _ = concurrent.futures.wait(
+                    self.streaming_pull_futures,
+                    timeout=1,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
                 )
+            for future in done:
+                future.result()  # raises the error that closed the stream, if any
+            return
 
-            except queue.Empty:
-                # hit the max wait. process the batch
-                self.batch_callback(batch)
-                batch, count = [], 0
-
-            # catch anything else and try to process the batch before raising
-            except (KeyboardInterrupt, Exception):
-                self.batch_callback(batch)
-                raise
-
-            else:
-                self._queue.task_done()
-                count += 1
+        # bind loop invariants to locals. this loop runs once per result.
+        results, results_ready, popleft = self._results, self._results_ready, self._results.popleft
+        batch_callback, batch_maxn = self.batch_callback, self.batch_maxn
+        timeout = self.batch_max_wait_between_messages
+        futures = self.streaming_pull_futures
+        # wake the loop when a stream closes instead of waiting out the timeout
+        for future in futures:
+            future.add_done_callback(lambda _: results_ready.set())
 
-            if count == self.batch_maxn:
-                # hit the max number of results. process the batch
-                self.batch_callback(batch)
-                batch, count = [], 0
+        batch, stream_closed = [], False
+        try:
+            while True:
+                # take whatever is already queued, up to a full batch. this is the only reader.
+                while results and len(batch) < batch_maxn:
+                    batch.append(popleft())
+
+                if len(batch) == batch_maxn:
+                    # hit the max number of results. process the batch
+                    full_batch, batch = batch, []
+                    batch_callback(full_batch)
+                    continue
+
+                # nothing queued. clear the event, then check again before waiting so that a
+                # result appended in between is not missed.
+                results_ready.clear()
+                if results:
+                    continue
+
+                if stream_closed:
+                    # everything queued has been taken. process the last batch and stop
+                    if batch:
+                        full_batch, batch = batch, []
+                        batch_callback(full_batch)
+                    for future in futures:
+                        if future.done():
+                            future.result()  # raises the error that closed the stream, if any
+                    return
+
+                ready = results_ready.wait(timeout)
+                # a stream failed or stop() was called. drain the queue once more, then stop
+                stream_closed = any(future.done() for future in futures)
+                if not ready and batch and not stream_closed:
+                    # hit the max wait. process the batch
+                    full_batch, batch = batch, []
+                    batch_callback(full_batch)
+
+        # catch anything else and try to process the batch before raising
+        except (KeyboardInterrupt, Exception):
+            if batch:
+                batch_callback(batch)
+            raise
 
     def stop(self) -> None:
-        """Attempt to shutdown the streaming pull and exit the background threads gracefully."""
+        """Attempt to shutdown the streaming pull(s) and exit the background threads gracefully."""
         LOGGER.info("closing the stream")
-        self.streaming_pull_future.cancel()  # trigger the shutdown
-        self.streaming_pull_future.result()  # block until the shutdown is complete
+        futures = self.streaming_pull_futures
+        # trigger the shutdown of every stream before waiting on any of them
+        for future in futures:
+            future.cancel()
+        try:
+            # wait for every stream to finish shutting down, even if one of them failed, so their
+            # clients are not closed under them. wait in short steps so Ctrl-C works on Windows.
+            not_done = futures
+            while not_done:
+                _, not_done = concurrent.futures.wait(not_done, timeout=1)
+            for future in futures:
+                future.result()  # raise the first stream's error, if any
+        finally:
+            # the first stream uses the subscription's (shared) client, so only close the extras
+            for client in self._stream_clients:
+                client.close()
+            self._stream_clients = []
 
     def pull_batch(self, max_messages: int = 1) -> List["Alert"]:
         """Pull a single batch of messages.
@@ -688,7 +954,8 @@ class Response:
         result (Any):
             Anything the user wishes to return. If not `None`, the Consumer will collect the results
             in a list and pass the list to the user's batch callback for further processing.
-            If there is no batch callback the results will be lost.
+            If there is no batch callback the results will be lost. Results wait in an unbounded
+            in-memory queue until the batch callback takes them, so keep them small.
 
     ----
     """
@@ -8,6 +8,7 @@
 
 ----
 """
+import functools
 import importlib.resources
 import logging
 from typing import Final
@@ -19,7 +20,50 @@ from . import exceptions, schema
 
 LOGGER = logging.getLogger(__name__)
 PACKAGE_DIR = importlib.resources.files(__package__)
-SCHEMA_MANIFEST = yaml.safe_load((PACKAGE_DIR / "registry_manifests/schemas.yml").read_text())
+
+
+@functools.cache
+def _load_schema_manifest() -> list[dict]:
+    """Load the schema manifest. Parsing the yaml is slow, so this is deferred until first use."""
+    return yaml.safe_load((PACKAGE_DIR / "registry_manifests/schemas.yml").read_text())
+
+
+@functools.cache
+def _schema_manifest_by_name() -> dict[str, dict]:
+    """Index the manifest by name so that exact-name lookups (the typical case) don't scan the list."""
+    return {schema["name"]: schema for schema in _load_schema_manifest()}
+
+
+def _get_schema(schema_name: str | None) -> schema.Schema:
+    """Load the schema with name matching `schema_name`. See :meth:`Schemas.get`."""
+    # If no schema_name provided, return the default.
+    if schema_name is None:
+        return schema.Schema._from_yaml(schema_dict=_schema_manifest_by_name()["default_schema"])
+
+    # Return the schema with name == schema_name, if one exists.
+    mft_schema = _schema_manifest_by_name().get(schema_name)
+    if mft_schema is not None:
+        return schema.Schema._from_yaml(schema_dict=mft_schema)
+
+    # Return the schema with name ~= schema_name, if one exists.
+    for mft_schema in _load_schema_manifest():
+        # Case 1: Split by "." and check whether first and last parts match.
+        # Catches names like 'lsst.v<MAJOR>_<MINOR>.alert' where users replace '<..>' with custom values.
+        split_name, split_mft_name = schema_name.split("."), mft_schema["name"].split(".")
+        if all([split_mft_name[i] == split_name[i] for i in [0, -1]]):
+            return schema.Schema._from_yaml(schema_dict=mft_schema, name=schema_name)
+
+    # That's all we know how to check so far.
+    raise exceptions.SchemaError(
+        f"{schema_name} not found. For valid names, see `pittgoogle.Schemas().names`."
+    )
+
+
+def __getattr__(name: str):
+    # Keep the module-level SCHEMA_MANIFEST available without loading it at import.
+    if name == "SCHEMA_MANIFEST":
+        return _load_schema_manifest()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @attrs.define(frozen=True)
@@ -74,32 +118,16 @@ class Schemas:
                 If a schema with name matching `schema_name` is not found in the registry.
             SchemaError:
                 If a schema definition cannot be loaded but one will be required to read the alert bytes.
+
+        Each call returns a new :class:`Schema`, so changes made to one (e.g., to its ``filter_map``)
+        don't reach other alerts. The parsed manifest, Avro definitions, and schema maps behind it
+        are cached, so this is cheap to call once per alert. The ``definition`` is shared between
+        schemas of the same name and should not be modified.
         """
         # If no schema_name provided, return the default.
         if schema_name is None:
             LOGGER.warning("No schema name provided. Returning a default schema.")
-            mft_schema = [
-                schema for schema in SCHEMA_MANIFEST if schema["name"] == "default_schema"
-            ][0]
-            return schema.Schema._from_yaml(schema_dict=mft_schema)
-
-        # Return the schema with name == schema_name, if one exists.
-        for mft_schema in SCHEMA_MANIFEST:
-            if mft_schema["name"] == schema_name:
-                return schema.Schema._from_yaml(schema_dict=mft_schema)
-
-        # Return the schema with name ~= schema_name, if one exists.
-        for mft_schema in SCHEMA_MANIFEST:
-            # Case 1: Split by "." and check whether first and last parts match.
-            # Catches names like 'lsst.v<MAJOR>_<MINOR>.alert' where users replace '<..>' with custom values.
-            split_name, split_mft_name = schema_name.split("."), mft_schema["name"].split(".")
-            if all([split_mft_name[i] == split_name[i] for i in [0, -1]]):
-                return schema.Schema._from_yaml(schema_dict=mft_schema, name=schema_name)
-
-        # That's all we know how to check so far.
-        raise exceptions.SchemaError(
-            f"{schema_name} not found. For valid names, see `pittgoogle.Schemas().names`."
-        )
+        return _get_schema(schema_name)
 
     @property
     def names(self) -> list[str]:
@@ -111,9 +139,9 @@ class Schemas:
         choose your own major and minor versions and use like ``pittgoogle.Schemas.get("lsst.v7_1.alert")``.
         View available schema versions by following the `origin` link in :attr:`Schemas.manifest`.
         """
-        return [schema["name"] for schema in SCHEMA_MANIFEST]
+        return [schema["name"] for schema in _load_schema_manifest()]
 
     @property
     def manifest(self) -> list[dict]:
         """List of dicts containing the registration information of all known schemas."""
-        return SCHEMA_MANIFEST
+        return _load_schema_manifest()
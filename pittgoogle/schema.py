@@ -8,6 +8,8 @@
 
 ----
 """
+import copy
+import functools
 import importlib.resources
 import io
 import json
@@ -25,6 +27,25 @@ LOGGER = logging.getLogger(__name__)
 PACKAGE_DIR = importlib.resources.files(__package__)
 
 
+@functools.cache
+def _load_avro_schema(path: Path) -> dict:
+    """Load and parse an ".avsc" file. Cached, since every alert's Schema needs one of the same few.
+
+    The returned definition is shared by every Schema loaded from ``path``, so don't modify it.
+    """
+    return fastavro.schema.load_schema(path)
+
+
+@functools.cache
+def _load_schema_map(survey: str) -> dict:
+    """Load the schema map for ``survey``. Cached, since parsing the yaml is slow.
+
+    Callers get the shared copy, so they must copy it before handing it out.
+    """
+    yml = PACKAGE_DIR / f"schemas/maps/{survey}.yml"
+    return yaml.safe_load(yml.read_text())
+
+
 @attrs.define(kw_only=True)
 class SchemaHelpers:
     """Class to organize helper functions.
@@ -60,7 +81,7 @@ class SchemaHelpers:
         if invalid_path:
             schema.definition = None
         else:
-            schema.definition = fastavro.schema.load_schema(schema.path)
+            schema.definition = _load_avro_schema(schema.path)
 
         return schema
 
@@ -70,7 +91,7 @@ class SchemaHelpers:
 
         # Resolve the path and load the schema
         schema.path = PACKAGE_DIR / schema.path
-        schema.definition = fastavro.schema.load_schema(schema.path)
+        schema.definition = _load_avro_schema(schema.path)
 
         return schema
 
@@ -87,7 +108,7 @@ class SchemaHelpers:
 
         # Resolve the path and load the schema
         schema.path = PACKAGE_DIR / schema.path
-        schema.definition = fastavro.schema.load_schema(schema.path)
+        schema.definition = _load_avro_schema(schema.path)
 
         return schema
 
@@ -177,7 +198,8 @@ class Schema:
                 The created `Schema` object.
         """
         # Combine the args and kwargs then let the helper finish up the initialization.
-        my_schema_dict = schema_dict.copy()
+        # Deep copy so the schema doesn't share mutable values (e.g., filter_map) with the manifest.
+        my_schema_dict = copy.deepcopy(schema_dict)
         my_schema_dict.update(schema_dict_replacements)
         helper = getattr(SchemaHelpers, my_schema_dict["helper"])
         return helper(my_schema_dict)
@@ -193,9 +215,9 @@ class Schema:
     def map(self) -> dict:
         """Mapping of Pitt-Google's generic field names to survey-specific field names."""
         if self._map is None:
-            yml = PACKAGE_DIR / f"schemas/maps/{self.survey}.yml"
             try:
-                self._map = yaml.safe_load(yml.read_text())
+                # copy, so that changes made to this schema's map don't reach other schemas
+                self._map = copy.deepcopy(_load_schema_map(self.survey))
             except FileNotFoundError:
                 raise ValueError(f"no schema map found for schema name '{self.name}'")
         return self._map
@@ -270,5 +292,8 @@ class _ConfluentWireAvroSchema(Schema):
         raise NotImplementedError("Confluent Wire Format not yet supported.")
 
     def deserialize(self, alert_bytes: bytes) -> dict:
-        bytes_io = io.BytesIO(alert_bytes[5:])
+        # Skip the 5-byte header (magic byte + schema ID) by seeking instead of slicing.
+        # BytesIO shares the buffer of the bytes it wraps, so this avoids copying the alert.
+        bytes_io = io.BytesIO(alert_bytes)
+        bytes_io.seek(5)
         return fastavro.schemaless_reader(bytes_io, self.definition)
@@ -9,6 +9,7 @@
 """
 import base64
 import collections
+import functools
 import io
 import json
 import logging
@@ -20,6 +21,30 @@ import fastavro
 
 LOGGER = logging.getLogger(__name__)
 
+# Header of an Avro object container file, as fixed by the Avro specification. Defined here rather
+# than taken from fastavro, which keeps its copy private. Parsed once and used for every alert.
+_AVRO_HEADER_SCHEMA = fastavro.parse_schema(
+    {
+        "type": "record",
+        "name": "org.apache.avro.file.Header",
+        "fields": [
+            {"name": "magic", "type": {"type": "fixed", "name": "magic", "size": 4}},
+            {"name": "meta", "type": {"type": "map", "values": "bytes"}},
+            {"name": "sync", "type": {"type": "fixed", "name": "sync", "size": 16}},
+        ],
+    }
+)
+_AVRO_MAGIC = b"Obj\x01"
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_avro_writer_schema(schema_json: bytes) -> dict:
+    """Parse the writer schema attached to an Avro file.
+
+    Alerts in a stream all carry the same few schemas, so parsing is cached on the schema's bytes.
+    """
+    return fastavro.parse_schema(json.loads(schema_json))
+
 
 @attrs.define
 class Cast:
@@ -84,11 +109,39 @@ class Cast:
         """
         if bytes_data is not None:
             with io.BytesIO(bytes_data) as fin:
-                alert_dicts = list(fastavro.reader(fin))  # list with single dict
+                alert_dicts = Cast._read_avro_records(fin, len(bytes_data))  # list with single dict
             if len(alert_dicts) != 1:
-                LOGGER.warning(f"Expected 1 Avro record. Found {len(alert_dicts)}.")
+                LOGGER.warning("Expected 1 Avro record. Found %d.", len(alert_dicts))
             return alert_dicts[0]
 
+    @staticmethod
+    def _read_avro_records(fin: io.BytesIO, size: int) -> list[dict]:
+        """Read all records from an Avro object container file.
+
+        ``fastavro.reader`` parses the writer schema from the header of every file it opens. For
+        uncompressed files, read the blocks directly with a cached copy of the parsed schema instead.
+        Compressed files are passed to ``fastavro.reader``.
+        """
+        if fin.read(4) != _AVRO_MAGIC:
+            raise ValueError("cannot read header - is it an avro file?")
+        fin.seek(0)
+        header = fastavro.schemaless_reader(fin, _AVRO_HEADER_SCHEMA)
+
+        if header["meta"].get("avro.codec", b"null") != b"null":
+            fin.seek(0)
+            return list(fastavro.reader(fin))
+
+        writer_schema = _parse_avro_writer_schema(header["meta"]["avro.schema"])
+        records = []
+        # Each block is: record count, block size in bytes, the records, sync marker.
+        while fin.tell() < size:
+            count = fastavro.schemaless_reader(fin, "long")
+            fastavro.schemaless_reader(fin, "long")
+            records.extend(fastavro.schemaless_reader(fin, writer_schema) for _ in range(count))
+            if fin.read(16) != header["sync"]:
+                raise ValueError("sync marker does not match")
+        return records
+
     @staticmethod
     def b64avro_to_dict(bytes_data):
         """Converts base64 encoded, Avro serialized bytes data to a dictionary.
@@ -0,0 +1,312 @@
+"""Tests for the pittgoogle.pubsub module."""
+
+import collections
+import concurrent.futures
+import unittest
+from unittest import mock
+
+import google.cloud.pubsub_v1
+
+from pittgoogle import pubsub
+from pittgoogle.auth import Auth
+
+
+def _consumer(**kwargs) -> pubsub.Consumer:
+    """Return a Consumer whose subscription won't be touched unless a test opens a stream."""
+    subscription = pubsub.Subscription("test-subscription", auth=Auth(GOOGLE_CLOUD_PROJECT="test"))
+    return pubsub.Consumer(subscription, msg_callback=lambda alert: pubsub.Response(), **kwargs)
+
+
+class FakeMessage:
+    """Stand-in for a PubsubMessage that records whether it was acked."""
+
+    def __init__(self) -> None:
+        self.data = b""
+        self.attributes = {}
+        self.acked = None
+
+    def ack(self) -> None:
+        self.acked = True
+
+    def nack(self) -> None:
+        self.acked = False
+
+
+class TestCallback(unittest.TestCase):
+    """The message callbacks that run on each streamed message."""
+
+    def test_alert_gets_subscription_schema_name(self) -> None:
+        alerts = []
+
+        def msg_callback(alert):
+            alerts.append(alert)
+            return pubsub.Response(ack=True, result=alert.schema_name)
+
+        subscription = pubsub.Subscription(
+            "test-subscription", auth=Auth(GOOGLE_CLOUD_PROJECT="test"), schema_name="ztf"
+        )
+        for batch_callback in (None, list):
+            with self.subTest(batch_callback=batch_callback):
+                consumer = pubsub.Consumer(
+                    subscription, msg_callback=msg_callback, batch_callback=batch_callback
+                )
+                message = FakeMessage()
+                if batch_callback is None:
+                    consumer._callback(message)
+                else:
+                    consumer._callback_with_results(message)
+                self.assertEqual(alerts[-1].schema_name, "ztf")
+                self.assertTrue(message.acked)
+
+
+class FakeEvent:
+    """Stand-in for the Consumer's results_ready Event that lets a test script each wait.
+
+    ``on_wait`` is called with the 1-based number of the wait and returns the value of the wait.
+    """
+
+    def __init__(self, results: collections.deque, on_wait, on_clear=None) -> None:
+        self.results = results
+        self.on_wait = on_wait
+        self.on_clear = on_clear
+        self.queued_at_wait = []
+
+    def set(self) -> None:
+        pass
+
+    def is_set(self) -> bool:
+        return False
+
+    def clear(self) -> None:
+        if self.on_clear is not None:
+            self.on_clear()
+
+    def wait(self, timeout=None) -> bool:
+        self.queued_at_wait.append(len(self.results))
+        if len(self.queued_at_wait) > 100:
+            # the loop didn't stop when the test expected it to. fail instead of hanging.
+            raise AssertionError(f"waited {len(self.queued_at_wait)} times")
+        return self.on_wait(len(self.queued_at_wait))
+
+
+class TestProcessBatches(unittest.TestCase):
+    """Consumer._process_batches with a batch_callback, driven by a fake results queue."""
+
+    def setUp(self) -> None:
+        self.batches = []
+        self.future = concurrent.futures.Future()
+
+    def _run(self, consumer: pubsub.Consumer, results: list, on_wait, on_clear=None) -> FakeEvent:
+        consumer._results = collections.deque(results)
+        consumer._results_ready = FakeEvent(consumer._results, on_wait, on_clear)
+        consumer.streaming_pull_futures = [self.future]
+        consumer._process_batches()
+        return consumer._results_ready
+
+    def _close_stream(self) -> bool:
+        self.future.set_result(None)
+        return True
+
+    def test_flush_full_batch(self) -> None:
+        consumer = _consumer(batch_callback=self.batches.append, batch_maxn=3)
+        flushed_at_wait = []
+
+        def on_wait(n):
+            flushed_at_wait.append(list(self.batches))
+            return self._close_stream()
+
+        self._run(consumer, range(7), on_wait)
+        # both full batches went out without waiting. the rest is flushed when the stream closes.
+        self.assertEqual(flushed_at_wait[0], [[0, 1, 2], [3, 4, 5]])
+        self.assertEqual(self.batches, [[0, 1, 2], [3, 4, 5], [6]])
+
+    def test_flush_on_timeout(self) -> None:
+        consumer = _consumer(batch_callback=self.batches.append, batch_maxn=10)
+
+        def on_wait(n):
+            if n == 1:
+                self.assertEqual(self.batches, [])
+                return False  # timeout
+            if n == 2:
+                self.assertEqual(self.batches, [[0, 1]])
+                consumer._results.append(2)
+                return True
+            if n == 3:
+                return False  # timeout
+            return self._close_stream()
+
+        self._run(consumer, [0, 1], on_wait)
+        self.assertEqual(self.batches, [[0, 1], [2]])
+
+    def test_no_empty_batches(self) -> None:
+        consumer = _consumer(batch_callback=self.batches.append, batch_maxn=10)
+
+        def on_wait(n):
+            if n < 4:
+                return False  # timeout with nothing queued
+            return self._close_stream()
+
+        self._run(consumer, [], on_wait)
+        self.assertEqual(self.batches, [])
+
+    def test_result_queued_during_clear(self) -> None:
+        # a callback thread appends a result (and sets the event) just before the reader clears it.
+        # the reader must find the result instead of waiting on the cleared event.
+        consumer = _consumer(batch_callback=self.batches.append, batch_maxn=10)
+        to_queue = [0]
+
+        def on_clear():
+            if to_queue:
+                consumer._results.append(to_queue.pop())
+
+        def on_wait(n):
+            if n == 1:
+                return False  # timeout
+            return self._close_stream()
+
+        event = self._run(consumer, [], on_wait, on_clear)
+        self.assertEqual(event.queued_at_wait, [0, 0])
+        self.assertEqual(self.batches, [[0]])
+
+    def test_stream_error(self) -> None:
+        consumer = _consumer(batch_callback=self.batches.append, batch_maxn=10)
+
+        def on_wait(n):
+            self.future.set_exception(RuntimeError("stream failed"))
+            return True
+
+        with self.assertRaisesRegex(RuntimeError, "stream failed"):
+            self._run(consumer, [0, 1], on_wait)
+        self.assertEqual(self.batches, [[0, 1]])
+
+    def test_batch_maxn_must_be_positive(self) -> None:
+        for batch_maxn in (0, -1):
+            with self.subTest(batch_maxn=batch_maxn):
+                with self.assertRaises(ValueError):
+                    _consumer(batch_callback=self.batches.append, batch_maxn=batch_maxn)
+
+
+class FakeStreamingPullFuture(concurrent.futures.Future):
+    """Stand-in for a StreamingPullFuture. Like the real one, cancel() resolves the future."""
+
+    def cancel(self) -> bool:
+        if not self.done():
+            self.set_result(None)
+        return True
+
+
+class FakeSubscriberClient(google.cloud.pubsub_v1.SubscriberClient):
+    """SubscriberClient that records its streaming pulls instead of opening them.
+
+    ``fail_after`` is the total number of streams (across all clients) after which subscribe
+    raises, or None to never fail. ``instances`` and ``futures`` collect every client and stream.
+    """
+
+    fail_after = None
+    instances = []
+    futures = []
+
+    def __init__(self, **kwargs) -> None:
+        self.instances.append(self)
+        self.kwargs = kwargs
+        self.subscribe_kwargs = []
+        self.is_closed = False
+
+    def subscribe(self, subscription, callback, **kwargs):
+        if len(self.futures) == self.fail_after:
+            raise RuntimeError("subscribe failed")
+        future = FakeStreamingPullFuture()
+        self.futures.append(future)
+        self.subscribe_kwargs.append(kwargs)
+        return future
+
+    def close(self) -> None:
+        self.is_closed = True
+
+
+class TestOpenStream(unittest.TestCase):
+    """Consumer._open_stream and Consumer.stop with several streams."""
+
+    def setUp(self) -> None:
+        FakeSubscriberClient.fail_after = None
+        FakeSubscriberClient.instances = []
+        FakeSubscriberClient.futures = []
+
+        patches = [
+            mock.patch.object(google.cloud.pubsub_v1, "SubscriberClient", FakeSubscriberClient),
+            mock.patch.object(Auth, "_get_credentials", return_value=mock.sentinel.credentials),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        # a subscription whose client was created by Subscription.client, not passed in by the user
+        self.subscription = pubsub.Subscription(
+            "test-subscription", auth=Auth(GOOGLE_CLOUD_PROJECT="test")
+        )
+        self.subscription._client = FakeSubscriberClient()
+        self.subscription._default_client = True
+
+    @property
+    def clients(self) -> list:
+        """Clients created by the Consumer for the streams after the first."""
+        return FakeSubscriberClient.instances[1:]
+
+    def _consumer(self, **kwargs) -> pubsub.Consumer:
+        return pubsub.Consumer(
+            self.subscription, msg_callback=lambda alert: pubsub.Response(), **kwargs
+        )
+
+    def test_opens_one_stream_per_client(self) -> None:
+        consumer = self._consumer(num_streams=3)
+        consumer._open_stream()
+
+        self.assertEqual(len(consumer.streaming_pull_futures), 3)
+        self.assertEqual(consumer.streaming_pull_futures, FakeSubscriberClient.futures)
+        # the subscription's client runs the first stream. each extra stream gets a new client.
+        self.assertEqual(len(self.subscription._client.subscribe_kwargs), 1)
+        self.assertEqual(len(self.clients), 2)
+        for client in self.clients:
+            self.assertEqual(len(client.subscribe_kwargs), 1)
+            self.assertIs(client.kwargs["credentials"], mock.sentinel.credentials)
+
+        consumer.stop()
+        self.assertTrue(all(future.done() for future in consumer.streaming_pull_futures))
+        self.assertTrue(all(client.is_closed for client in self.clients))
+        self.assertFalse(self.subscription._client.is_closed)
+
+    def test_flow_control_split_across_streams(self) -> None:
+        consumer = self._consumer(num_streams=3, max_backlog=1000, max_backlog_bytes=100)
+        consumer._open_stream()
+        self.addCleanup(consumer.stop)
+
+        clients = [self.subscription._client] + self.clients
+        for client in clients:
+            flow_control = client.subscribe_kwargs[0]["flow_control"]
+            # ceil(1000 / 3) and ceil(100 / 3)
+            self.assertEqual(flow_control.max_messages, 334)
+            self.assertEqual(flow_control.max_bytes, 34)
+
+    def test_user_client_runs_every_stream(self) -> None:
+        self.subscription._default_client = False
+        consumer = self._consumer(num_streams=2)
+        consumer._open_stream()
+        consumer.stop()
+
+        self.assertEqual(len(self.subscription._client.subscribe_kwargs), 2)
+        self.assertEqual(self.clients, [])
+        Auth._get_credentials.assert_not_called()
+
+    def test_partial_open_failure(self) -> None:
+        FakeSubscriberClient.fail_after = 2
+        consumer = self._consumer(num_streams=3)
+
+        with self.assertRaisesRegex(RuntimeError, "subscribe failed"):
+            consumer._open_stream()
+
+        # the streams that did open are registered and shut down. the extra clients are closed.
+        self.assertEqual(len(consumer.streaming_pull_futures), 2)
+        self.assertTrue(all(future.done() for future in consumer.streaming_pull_futures))
+        self.assertEqual(len(self.clients), 2)
+        self.assertTrue(all(client.is_closed for client in self.clients))
+        self.assertEqual(consumer._stream_clients, [])
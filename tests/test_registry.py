@@ -0,0 +1,19 @@
+"""Tests for the pittgoogle.registry module."""
+
+import unittest
+
+from pittgoogle.registry import Schemas
+
+
+class TestSchemasGet(unittest.TestCase):
+    """Schemas.get caches what it loads but must not share mutable state between calls."""
+
+    def test_new_schema_each_call(self) -> None:
+        first, second = Schemas.get("ztf"), Schemas.get("ztf")
+        self.assertIsNot(first, second)
+
+        first.filter_map[1] = "changed"
+        first.map["changed"] = "changed"
+        self.assertNotEqual(second.filter_map[1], "changed")
+        self.assertNotIn("changed", second.map)
+        self.assertNotIn("changed", Schemas.get("ztf").map)
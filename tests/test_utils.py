@@ -0,0 +1,68 @@
+"""Tests for the pittgoogle.utils module."""
+
+import importlib.resources
+import io
+import unittest
+
+import fastavro
+
+from pittgoogle.utils import Cast
+
+SAMPLE_DATA = [
+    importlib.resources.files("pittgoogle") / f"schemas/lsst/7/{minor}/sample_data/fakeAlert.avro"
+    for minor in (0, 1)
+]
+SCHEMA = {
+    "type": "record",
+    "name": "Record",
+    "fields": [{"name": "id", "type": "long"}, {"name": "name", "type": "string"}],
+}
+RECORDS = [{"id": i, "name": f"record {i}"} for i in range(50)]
+
+
+def _write_avro(codec: str, sync_interval: int = 16000) -> bytes:
+    """Write RECORDS to an Avro object container file using the given codec."""
+    with io.BytesIO() as fout:
+        fastavro.writer(fout, SCHEMA, RECORDS, codec=codec, sync_interval=sync_interval)
+        return fout.getvalue()
+
+
+def _fastavro_records(bytes_data: bytes) -> list[dict]:
+    """Read all records with ``fastavro.reader``, for comparison."""
+    with io.BytesIO(bytes_data) as fin:
+        return list(fastavro.reader(fin))
+
+
+def _read_avro_records(bytes_data: bytes) -> list[dict]:
+    """Read all records with ``Cast._read_avro_records``."""
+    with io.BytesIO(bytes_data) as fin:
+        return Cast._read_avro_records(fin, len(bytes_data))
+
+
+class TestReadAvroRecords(unittest.TestCase):
+    """Cast._read_avro_records must return the same records as fastavro.reader."""
+
+    def test_sample_alerts(self) -> None:
+        for path in SAMPLE_DATA:
+            with self.subTest(path=str(path)):
+                bytes_data = path.read_bytes()
+                expected = _fastavro_records(bytes_data)
+                self.assertEqual(_read_avro_records(bytes_data), expected)
+                self.assertEqual(Cast.avro_to_dict(bytes_data), expected[0])
+
+    def test_multiple_blocks(self) -> None:
+        bytes_data = _write_avro("null", sync_interval=64)
+        with io.BytesIO(bytes_data) as fin:
+            self.assertGreater(len(list(fastavro.block_reader(fin))), 1)
+        self.assertEqual(_read_avro_records(bytes_data), _fastavro_records(bytes_data))
+
+    def test_deflate(self) -> None:
+        bytes_data = _write_avro("deflate")
+        self.assertEqual(_read_avro_records(bytes_data), _fastavro_records(bytes_data))
+
+    def test_not_avro(self) -> None:
+        bytes_data = b'{"id": 1, "name": "record 1"}'
+        with self.assertRaises(ValueError):
+            _fastavro_records(bytes_data)
+        with self.assertRaises(ValueError):
+            _read_avro_records(bytes_data)